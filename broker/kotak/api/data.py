@@ -1,16 +1,171 @@
-import json
+import logging
+import re
+import socket
+import threading
 import time
 import urllib.parse
+from types import MappingProxyType
 
 import httpx
+import orjson
 import pandas as pd
 
-from database.token_db import get_br_symbol, get_brexchange, get_token
+from database.token_db import get_symbol_info
 from utils.httpx_client import get_httpx_client
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# OpenAlgo exchange -> Kotak exchange segment
+_KOTAK_EXCHANGE_MAP = {
+    "NSE": "nse_cm",
+    "BSE": "bse_cm",
+    "NFO": "nse_fo",
+    "BFO": "bse_fo",
+    "CDS": "cde_fo",
+    "MCX": "mcx_fo",
+    "NSE_INDEX": "nse_cm",
+    "BSE_INDEX": "bse_cm",
+}
+
+# Index exchanges are queried by index name rather than pSymbol
+_INDEX_EXCHANGES = frozenset({"NSE_INDEX", "BSE_INDEX"})
+
+# OpenAlgo index symbol -> Kotak Neo API index name
+_INDEX_SYMBOL_MAP = {
+    "NIFTY": "Nifty 50",
+    "NIFTY50": "Nifty 50",
+    "BANKNIFTY": "Nifty Bank",
+    "SENSEX": "SENSEX",
+    "BANKEX": "BANKEX",
+    "FINNIFTY": "Nifty Fin Service",
+    "MIDCPNIFTY": "NIFTY MIDCAP 100",
+}
+
+# Fallback payloads for failed quote/depth requests; handed out as copies so
+# callers can never mutate the shared templates
+_DEFAULT_QUOTE = {
+    "bid": 0,
+    "ask": 0,
+    "open": 0,
+    "high": 0,
+    "low": 0,
+    "ltp": 0,
+    "prev_close": 0,
+    "volume": 0,
+    "oi": 0,
+}
+
+_DEFAULT_DEPTH = {
+    "bids": [{"price": 0, "quantity": 0} for _ in range(5)],
+    "asks": [{"price": 0, "quantity": 0} for _ in range(5)],
+    "totalbuyqty": 0,
+    "totalsellqty": 0,
+}
+# Kotak Neo has no historical data API, so no intervals are supported
+_SUPPORTED_INTERVALS = MappingProxyType(
+    {
+        "seconds": (),
+        "minutes": (),
+        "hours": (),
+        "days": (),
+        "weeks": (),
+        "months": (),
+    }
+)
+
+# Neo API v2 OHLC fields, in OpenAlgo open/high/low/prev_close order
+_OHLC_KEYS = ("open", "high", "low", "close")
+
+
+def _format_quote(quote_data):
+    """Convert a Neo API v2 quote into the OpenAlgo quote format"""
+    ohlc_data = quote_data.get("ohlc") or {}
+    depth_data = quote_data.get("depth") or {}  # Guard against null depth
+    buy_orders = depth_data.get("buy") or []
+    sell_orders = depth_data.get("sell") or []
+
+    ltp = float(quote_data.get("ltp", 0))
+    open_price, high, low, prev_close = map(float, (ohlc_data.get(k, 0) for k in _OHLC_KEYS))
+
+    return {
+        # Best bid/ask come from depth; fall back to LTP when the book is empty
+        "bid": float(buy_orders[0].get("price", 0)) if buy_orders else ltp,
+        "ask": float(sell_orders[0].get("price", 0)) if sell_orders else ltp,
+        "open": open_price,
+        "high": high,
+        "low": low,
+        "ltp": ltp,
+        "prev_close": prev_close,
+        "volume": float(quote_data.get("last_volume", 0)),
+        "oi": int(quote_data.get("open_int", 0)),
+    }
+
+
+# Characters urllib.parse.quote(safe="|,") leaves as-is, plus space
+_PLAIN_QUERY_RE = re.compile(r"[A-Za-z0-9_.~|,\- ]*")
+
+
+def _fast_encode_query(query):
+    """
+    URL-encode a quotes query, keeping pipe/comma characters.
+    pSymbol and index-name queries only ever need spaces escaped, so skip quote() for them.
+    """
+    if _PLAIN_QUERY_RE.fullmatch(query):
+        return query.replace(" ", "%20")
+    return urllib.parse.quote(query, safe="|,")
+
+
+def _get_psymbol_and_brexchange(symbol, exchange):
+    """
+    Resolve Kotak pSymbol (stored as token) and broker exchange with one symbol lookup.
+    Served from the in-memory symbol cache, which is reloaded with the master contract.
+    """
+    info = get_symbol_info(symbol, exchange)
+    if info is None:
+        return None, None
+    return info.token, info.brexchange
+
+
+def _parse_depth_levels(levels):
+    """Top 5 depth levels as price/quantity dicts, padded with empty levels"""
+    if not isinstance(levels, list):
+        levels = []
+    parsed = [
+        {"price": float(level.get("price", 0)), "quantity": int(level.get("quantity", 0))}
+        for level in levels[:5]
+    ]
+    parsed.extend({"price": 0, "quantity": 0} for _ in range(5 - len(parsed)))
+    return parsed
+
+
+# Quote hosts already warmed in this process; sessions share the pooled httpx client
+_warmed_hosts = set()
+_warmup_lock = threading.Lock()
+
+
+def _warm_quotes_connection(base_url):
+    """Resolve the quotes host and open a pooled TLS connection to it (best effort)"""
+    try:
+        host = urllib.parse.urlsplit(base_url).hostname
+        if host:
+            socket.getaddrinfo(host, 443)
+        get_httpx_client().head(base_url, timeout=2.0)
+    except Exception as e:
+        logger.debug("Quotes connection warmup failed for %s: %s", base_url, e)
+
+
+def _start_quotes_warmup(base_url):
+    """Warm the quotes connection in a background thread, once per host"""
+    host = urllib.parse.urlsplit(base_url).hostname
+    with _warmup_lock:
+        if host in _warmed_hosts:
+            return
+        _warmed_hosts.add(host)
+    threading.Thread(
+        target=_warm_quotes_connection, args=(base_url,), name="kotak-quotes-warmup", daemon=True
+    ).start()
+
 
 class BrokerData:
     def __init__(self, auth_token):
@@ -30,87 +185,77 @@ class BrokerData:
         self.last_quote_error = None
         logger.info(f"Using quotes baseUrl: {self.quotes_base_url}")
 
+        # Quote headers never change for a session, so build them once. The shared
+        # httpx client already keeps pooled (HTTP/2 when negotiated) connections alive.
+        self._quote_headers = {
+            "Authorization": self.access_token,
+            "Content-Type": "application/json",
+        }
+        self._quote_url_prefix = f"{self.quotes_base_url}/script-details/1.0/quotes/neosymbol/"
+
+        # Move DNS + TLS handshake off the first quote request
+        _start_quotes_warmup(self.quotes_base_url)
+
         # Define empty timeframe map since Kotak Neo doesn't support historical data
         self.timeframe_map = {}
         logger.warning("Kotak Neo does not support historical data intervals")
 
     def _get_kotak_exchange(self, exchange):
         """Map OpenAlgo exchange to Kotak exchange segment"""
-        exchange_map = {
-            "NSE": "nse_cm",
-            "BSE": "bse_cm",
-            "NFO": "nse_fo",
-            "BFO": "bse_fo",
-            "CDS": "cde_fo",
-            "MCX": "mcx_fo",
-            "NSE_INDEX": "nse_cm",
-            "BSE_INDEX": "bse_cm",
-        }
-        return exchange_map.get(exchange)
+        return _KOTAK_EXCHANGE_MAP.get(exchange)
 
     def _get_index_symbol(self, symbol):
         """Map OpenAlgo index symbols to Kotak Neo API format"""
-        index_map = {
-            "NIFTY": "Nifty 50",
-            "NIFTY50": "Nifty 50",
-            "BANKNIFTY": "Nifty Bank",
-            "SENSEX": "SENSEX",
-            "BANKEX": "BANKEX",
-            "FINNIFTY": "Nifty Fin Service",
-            "MIDCPNIFTY": "NIFTY MIDCAP 100",
-        }
         # Return mapped symbol or original symbol if not found
-        return index_map.get(symbol.upper(), symbol)
+        return _INDEX_SYMBOL_MAP.get(symbol.upper(), symbol)
 
     def _make_quotes_request(self, query, filter_name="all"):
         """Make HTTP request to Neo API v2 quotes endpoint using httpx connection pooling"""
         client = get_httpx_client()
 
         # URL encode spaces but keep pipe/comma characters
-        encoded_query = urllib.parse.quote(query, safe="|,")
-        endpoint = f"/script-details/1.0/quotes/neosymbol/{encoded_query}/{filter_name}"
-
-        headers = {"Authorization": self.access_token, "Content-Type": "application/json"}
-
-        url = f"{self.quotes_base_url}{endpoint}"
+        url = self._quote_url_prefix + _fast_encode_query(query) + "/" + filter_name
         last_error = None
 
         try:
-            logger.info(f"QUOTES API - Making request to: {url}")
-            logger.debug(f"QUOTES API - Using access_token: {self.access_token[:10]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("QUOTES API - Making request to: %s", url)
+                logger.debug("QUOTES API - Using access_token: %s...", self.access_token[:10])
 
-            response = client.get(url, headers=headers)
-            logger.info(f"QUOTES API - Response status: {response.status_code} for {url}")
+            response = client.get(url, headers=self._quote_headers)
+            logger.debug("QUOTES API - Response status: %s for %s", response.status_code, url)
 
             if response.status_code == 200:
-                response_data = json.loads(response.text)
-                logger.debug(
-                    f"QUOTES API - Raw response: {response.text[:200]}..."
-                )  # Log first 200 chars
-
-                # Log the complete structure for debugging (only for depth requests)
-                if (
-                    "depth" in endpoint
-                    and response_data
-                    and isinstance(response_data, list)
-                    and len(response_data) > 0
-                ):
-                    logger.debug(
-                        f"DEPTH API - Complete raw response structure: {json.dumps(response_data[0], indent=2)}"
-                    )
+                # Parse straight from bytes - skips the charset decode of response.text
+                response_data = orjson.loads(response.content)
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Log first 200 bytes
+                    logger.debug("QUOTES API - Raw response: %r...", response.content[:200])
+
+                    # Log the complete structure for debugging (only for depth requests)
+                    if (
+                        filter_name == "depth"
+                        and response_data
+                        and isinstance(response_data, list)
+                        and len(response_data) > 0
+                    ):
+                        logger.debug(
+                            "DEPTH API - Complete raw response structure: %s",
+                            orjson.dumps(response_data[0], option=orjson.OPT_INDENT_2).decode(),
+                        )
 
                 self.last_quote_error = None
                 return response_data
 
             last_error = {"status": response.status_code, "body": response.text[:500], "url": url}
-            logger.warning(f"QUOTES API - HTTP {response.status_code}: {response.text[:200]}...")
+            logger.warning("QUOTES API - HTTP %s: %s...", response.status_code, response.text[:200])
 
         except httpx.HTTPError as e:
             last_error = {"error": str(e), "url": url}
-            logger.error(f"HTTP error in _make_quotes_request ({url}): {e}")
+            logger.error("HTTP error in _make_quotes_request (%s): %s", url, e)
         except Exception as e:
             last_error = {"error": str(e), "url": url}
-            logger.error(f"Error in _make_quotes_request ({url}): {e}")
+            logger.error("Error in _make_quotes_request (%s): %s", url, e)
 
         self.last_quote_error = last_error
         return None
@@ -118,136 +263,95 @@ class BrokerData:
     def get_quotes(self, symbol, exchange):
         """Get live quotes using Neo API v2 quotes endpoint with pSymbol-based queries"""
         try:
-            logger.info(f"QUOTES API - Symbol: {symbol}, Exchange: {exchange}")
+            logger.debug("QUOTES API - Symbol: %s, Exchange: %s", symbol, exchange)
 
             # Check if this is an index - use symbol name instead of pSymbol
-            if "INDEX" in exchange.upper():
+            if exchange in _INDEX_EXCHANGES:
                 # For indices, map to correct Neo API format and use static exchange mapping
                 kotak_exchange = self._get_kotak_exchange(exchange)
                 neo_symbol = self._get_index_symbol(symbol)
                 query = f"{kotak_exchange}|{neo_symbol}"
-                logger.info(f"QUOTES API - Index query: {symbol} → {neo_symbol} → {query}")
+                logger.debug("QUOTES API - Index query: %s → %s → %s", symbol, neo_symbol, query)
             else:
                 # For regular stocks/F&O, get both pSymbol and brexchange from database
                 # In Kotak DB: token = pSymbol, brexchange = nse_cm/nse_fo/bse_cm etc.
-                psymbol = get_token(symbol, exchange)
-                brexchange = get_brexchange(symbol, exchange)
-                logger.info(f"QUOTES API - pSymbol: {psymbol}, brexchange: {brexchange}")
+                psymbol, brexchange = _get_psymbol_and_brexchange(symbol, exchange)
+                logger.debug("QUOTES API - pSymbol: %s, brexchange: %s", psymbol, brexchange)
 
                 if not psymbol or not brexchange:
-                    logger.error(f"pSymbol or brexchange not found for {symbol} on {exchange}")
+                    logger.error("pSymbol or brexchange not found for %s on %s", symbol, exchange)
                     return self._get_default_quote()
 
                 # Map brexchange to correct Kotak format if needed
                 if brexchange in ["NSE", "BSE", "NFO", "BFO", "CDS", "MCX"]:
                     kotak_exchange = self._get_kotak_exchange(brexchange)
-                    logger.info(f"QUOTES API - Mapped {brexchange} to {kotak_exchange}")
+                    logger.debug("QUOTES API - Mapped %s to %s", brexchange, kotak_exchange)
                 else:
                     kotak_exchange = brexchange  # Already in correct format
 
                 # Build query using mapped exchange: kotak_exchange|pSymbol
                 query = f"{kotak_exchange}|{psymbol}"
-                logger.info(f"QUOTES API - Query: {query}")
+                logger.debug("QUOTES API - Query: %s", query)
 
             # Make API request
             response = self._make_quotes_request(query, "all")
 
             if response and isinstance(response, list) and len(response) > 0:
                 quote_data = response[0]
-                logger.info(
-                    f"QUOTES API - Query successful for: {quote_data.get('display_symbol')}"
+                logger.debug(
+                    "QUOTES API - Query successful for: %s", quote_data.get("display_symbol")
                 )
             else:
                 logger.error(
-                    f"QUOTES API - Query failed for {symbol}; last_error={self.last_quote_error}"
+                    "QUOTES API - Query failed for %s; last_error=%s", symbol, self.last_quote_error
                 )
                 return None
 
-            if response and isinstance(response, list) and len(response) > 0:
-                quote_data = response[0]
-
-                # Parse Neo API v2 response format (based on actual API response)
-                ohlc_data = quote_data.get("ohlc", {})
-                ltp_parsed = float(quote_data.get("ltp", 0))
-
-                # Get depth data for actual bid/ask prices
-                depth_data = quote_data.get("depth", {})
-                buy_orders = depth_data.get("buy", [])
-                sell_orders = depth_data.get("sell", [])
-
-                # Extract best bid and ask prices from depth
-                bid_price = float(buy_orders[0].get("price", 0)) if buy_orders else ltp_parsed
-                ask_price = float(sell_orders[0].get("price", 0)) if sell_orders else ltp_parsed
-
-                # Get total quantities (for reference)
-                total_buy_qty = quote_data.get("total_buy", 0)
-                total_sell_qty = quote_data.get("total_sell", 0)
-
-                logger.debug(
-                    f"QUOTES API - Parsing for {quote_data.get('display_symbol', 'unknown')}:"
-                )
-                logger.debug(f"  - ltp: {ltp_parsed}")
-                logger.debug(f"  - total_buy_qty: {total_buy_qty} (quantity, not price)")
-                logger.debug(f"  - total_sell_qty: {total_sell_qty} (quantity, not price)")
-                logger.debug(f"  - best_bid_price: {bid_price}")
-                logger.debug(f"  - best_ask_price: {ask_price}")
-
-                return {
-                    "bid": bid_price,
-                    "ask": ask_price,
-                    "open": float(ohlc_data.get("open", 0)),
-                    "high": float(ohlc_data.get("high", 0)),
-                    "low": float(ohlc_data.get("low", 0)),
-                    "ltp": ltp_parsed,
-                    "prev_close": float(ohlc_data.get("close", 0)),
-                    "volume": float(quote_data.get("last_volume", 0)),
-                    "oi": int(quote_data.get("open_int", 0)),  # Available in response
-                }
-            elif response is not None:
-                # API returned 200 but empty response - this is normal for some symbols
-                logger.info(f"Empty response received for {symbol} - API returned 200 but no data")
-                return self._get_default_quote()
-            else:
-                logger.warning(f"No quote data received for {symbol}")
-                return self._get_default_quote()
+            # Parse Neo API v2 response format (based on actual API response)
+            result = _format_quote(quote_data)
+            logger.debug(
+                "QUOTES API - Parsed quote for %s: %s",
+                quote_data.get("display_symbol", "unknown"),
+                result,
+            )
+            return result
 
         except Exception as e:
-            logger.error(f"Error in get_quotes: {e}")
+            logger.error("Error in get_quotes: %s", e)
             return self._get_default_quote()
 
     def get_depth(self, symbol: str, exchange: str) -> dict:
         """Get market depth using Neo API v2 quotes endpoint with depth filter"""
         try:
-            logger.info(f"DEPTH API - Symbol: {symbol}, Exchange: {exchange}")
+            logger.debug("DEPTH API - Symbol: %s, Exchange: %s", symbol, exchange)
 
             # Check if this is an index - use symbol name instead of pSymbol
-            if "INDEX" in exchange.upper():
+            if exchange in _INDEX_EXCHANGES:
                 # For indices, map to correct Neo API format and use static exchange mapping
                 kotak_exchange = self._get_kotak_exchange(exchange)
                 neo_symbol = self._get_index_symbol(symbol)
                 query = f"{kotak_exchange}|{neo_symbol}"
-                logger.debug(f"DEPTH API - Index query: {symbol} → {neo_symbol} → {query}")
+                logger.debug("DEPTH API - Index query: %s → %s → %s", symbol, neo_symbol, query)
             else:
                 # For regular stocks/F&O, get both pSymbol and brexchange from database
                 # In Kotak DB: token = pSymbol, brexchange = nse_cm/nse_fo/bse_cm etc.
-                psymbol = get_token(symbol, exchange)
-                brexchange = get_brexchange(symbol, exchange)
-                logger.info(f"DEPTH API - pSymbol: {psymbol}, brexchange: {brexchange}")
+                psymbol, brexchange = _get_psymbol_and_brexchange(symbol, exchange)
+                logger.debug("DEPTH API - pSymbol: %s, brexchange: %s", psymbol, brexchange)
 
                 if not psymbol or brexchange is None:
-                    logger.error(f"pSymbol or brexchange not found for {symbol} on {exchange}")
+                    logger.error("pSymbol or brexchange not found for %s on %s", symbol, exchange)
                     return self._get_default_depth()
 
                 # Map brexchange to correct Kotak format if needed
                 if brexchange in ["NSE", "BSE", "NFO", "BFO", "CDS", "MCX"]:
                     kotak_exchange = self._get_kotak_exchange(brexchange)
-                    logger.info(f"DEPTH API - Mapped {brexchange} to {kotak_exchange}")
+                    logger.debug("DEPTH API - Mapped %s to %s", brexchange, kotak_exchange)
                 else:
                     kotak_exchange = brexchange  # Already in correct format
 
                 # Build query using mapped exchange: kotak_exchange|pSymbol
                 query = f"{kotak_exchange}|{psymbol}"
-                logger.debug(f"DEPTH API - Query: {query}")
+                logger.debug("DEPTH API - Query: %s", query)
 
             # Make API request with depth filter
             response = self._make_quotes_request(query, "depth")
@@ -256,48 +360,14 @@ class BrokerData:
                 target_quote = response[0]
                 depth_data = target_quote.get("depth", {})
 
-                logger.debug(f"DEPTH API - Raw depth data: {depth_data}")
+                logger.debug("DEPTH API - Raw depth data: %s", depth_data)
 
                 # Parse Neo API v2 depth format (based on actual API response)
-                bids = []
-                asks = []
-
-                # Process buy orders (bids) - handle both array and object formats
-                buy_data = depth_data.get("buy", [])
-                logger.debug(f"DEPTH API - Buy data: {buy_data}")
-
-                if isinstance(buy_data, list):
-                    for i, bid in enumerate(buy_data[:5]):  # Top 5 bids
-                        logger.debug(f"DEPTH API - Processing bid {i}: {bid}")
-                        bids.append(
-                            {
-                                "price": float(bid.get("price", 0)),
-                                "quantity": int(bid.get("quantity", 0)),
-                            }
-                        )
-
-                # Process sell orders (asks) - handle both array and object formats
-                sell_data = depth_data.get("sell", [])
-                logger.debug(f"DEPTH API - Sell data: {sell_data}")
+                bids = _parse_depth_levels(depth_data.get("buy", []))
+                asks = _parse_depth_levels(depth_data.get("sell", []))
 
-                if isinstance(sell_data, list):
-                    for i, ask in enumerate(sell_data[:5]):  # Top 5 asks
-                        logger.debug(f"DEPTH API - Processing ask {i}: {ask}")
-                        asks.append(
-                            {
-                                "price": float(ask.get("price", 0)),
-                                "quantity": int(ask.get("quantity", 0)),
-                            }
-                        )
-
-                logger.debug(f"DEPTH API - Parsed bids: {bids}")
-                logger.debug(f"DEPTH API - Parsed asks: {asks}")
-
-                # Ensure we have 5 levels
-                while len(bids) < 5:
-                    bids.append({"price": 0, "quantity": 0})
-                while len(asks) < 5:
-                    asks.append({"price": 0, "quantity": 0})
+                logger.debug("DEPTH API - Parsed bids: %s", bids)
+                logger.debug("DEPTH API - Parsed asks: %s", asks)
 
                 total_buy_qty = sum(bid["quantity"] for bid in bids if bid["quantity"] > 0)
                 total_sell_qty = sum(ask["quantity"] for ask in asks if ask["quantity"] > 0)
@@ -309,14 +379,14 @@ class BrokerData:
                     "totalsellqty": total_sell_qty,
                 }
 
-                logger.debug(f"DEPTH API - Final result: {result}")
+                logger.debug("DEPTH API - Final result: %s", result)
                 return result
             else:
-                logger.warning(f"No depth data received for {symbol}")
+                logger.warning("No depth data received for %s", symbol)
                 return self._get_default_depth()
 
         except Exception as e:
-            logger.error(f"Error in get_depth: {e}")
+            logger.error("Error in get_depth: %s", e)
             return self._get_default_depth()
 
     def get_multiquotes(self, symbols: list) -> list:
@@ -384,14 +454,13 @@ class BrokerData:
 
             try:
                 # Check if this is an index
-                if "INDEX" in exchange.upper():
+                if exchange in _INDEX_EXCHANGES:
                     kotak_exchange = self._get_kotak_exchange(exchange)
                     neo_symbol = self._get_index_symbol(symbol)
                     query = f"{kotak_exchange}|{neo_symbol}"
                 else:
                     # For regular stocks/F&O, get pSymbol and brexchange
-                    psymbol = get_token(symbol, exchange)
-                    brexchange = get_brexchange(symbol, exchange)
+                    psymbol, brexchange = _get_psymbol_and_brexchange(symbol, exchange)
 
                     if not psymbol or not brexchange:
                         logger.warning(
@@ -490,30 +559,10 @@ class BrokerData:
                 )
                 continue
 
-            # Parse and format quote data
-            ohlc_data = quote_data.get("ohlc", {})
-            depth_data = quote_data.get("depth") or {}  # Guard against null depth
-            buy_orders = depth_data.get("buy", [])
-            sell_orders = depth_data.get("sell", [])
-
-            ltp = float(quote_data.get("ltp", 0))
-            bid_price = float(buy_orders[0].get("price", 0)) if buy_orders else ltp
-            ask_price = float(sell_orders[0].get("price", 0)) if sell_orders else ltp
-
             result_item = {
                 "symbol": original["symbol"],
                 "exchange": original["exchange"],
-                "data": {
-                    "bid": bid_price,
-                    "ask": ask_price,
-                    "open": float(ohlc_data.get("open", 0)),
-                    "high": float(ohlc_data.get("high", 0)),
-                    "low": float(ohlc_data.get("low", 0)),
-                    "ltp": ltp,
-                    "prev_close": float(ohlc_data.get("close", 0)),
-                    "volume": float(quote_data.get("last_volume", 0)),
-                    "oi": int(quote_data.get("open_int", 0)),
-                },
+                "data": _format_quote(quote_data),
             }
             results.append(result_item)
 
@@ -522,25 +571,14 @@ class BrokerData:
 
     def _get_default_quote(self):
         """Return default quote structure"""
-        return {
-            "bid": 0,
-            "ask": 0,
-            "open": 0,
-            "high": 0,
-            "low": 0,
-            "ltp": 0,
-            "prev_close": 0,
-            "volume": 0,
-            "oi": 0,
-        }
+        return _DEFAULT_QUOTE.copy()
 
     def _get_default_depth(self):
         """Return default depth structure"""
         return {
-            "bids": [{"price": 0, "quantity": 0} for _ in range(5)],
-            "asks": [{"price": 0, "quantity": 0} for _ in range(5)],
-            "totalbuyqty": 0,
-            "totalsellqty": 0,
+            **_DEFAULT_DEPTH,
+            "bids": [level.copy() for level in _DEFAULT_DEPTH["bids"]],
+            "asks": [level.copy() for level in _DEFAULT_DEPTH["asks"]],
         }
 
     def get_history(
@@ -551,15 +589,11 @@ class BrokerData:
         logger.warning("Kotak Neo does not support historical data")
         return empty_df
 
-    def get_supported_intervals(self) -> dict:
-        """Return supported intervals matching the format expected by intervals.py"""
-        intervals = {
-            "seconds": [],
-            "minutes": [],
-            "hours": [],
-            "days": [],
-            "weeks": [],
-            "months": [],
-        }
-        logger.warning("Kotak Neo does not support historical data intervals")
-        return intervals
+    def get_supported_intervals(self) -> MappingProxyType:
+        """
+        Return supported intervals matching the format expected by intervals.py
+
+        The mapping is shared and read-only; the unsupported-intervals warning is
+        logged once in __init__ rather than on every poll.
+        """
+        return _SUPPORTED_INTERVALS
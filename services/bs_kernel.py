@@ -0,0 +1,293 @@
+"""
+Black-76 Pricing Kernel
+Vectorized Black-76 price, implied volatility and Greeks for the option Greeks service.
+
+All functions accept scalars or NumPy arrays (broadcast together) so the same
+kernel serves single-option requests and whole option chains in one pass.
+
+Conventions match py_vollib's Black model so responses stay unchanged:
+    - F is the futures/forward price, r and sigma are decimals, T is in years
+    - theta is per calendar day, vega and rho are per 1% change
+
+bs_greeks() is the single-option entry point. When numba is installed it is
+compiled to native code when this module is first imported (the Greeks service
+imports it lazily, so the first Greeks request pays the compile or cache load);
+otherwise the same scalar code runs as plain Python.
+"""
+
+import math
+
+import numpy as np
+from scipy.special import ndtr
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+_INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+# Implied volatility search bracket (decimal) and solver settings. The upper
+# bound is only a starting point: it is doubled up to _IV_MAX_EXPAND times until
+# it brackets the price, so very high IVs (near expiry) still solve.
+_IV_LOWER = 1e-6
+_IV_UPPER = 10.0
+_IV_MAX_EXPAND = 40
+_IV_TOLERANCE = 1e-10
+_IV_MAX_ITER = 100
+
+# Why an option price has no implied volatility, from _iv_bounds_status()
+_IV_OK = 0
+_IV_BELOW_INTRINSIC = 1  # price at or below discounted intrinsic value
+_IV_ABOVE_MAXIMUM = 2  # price at or above the discounted forward (call) / strike (put)
+
+
+def _norm_pdf(x):
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+def _d1_d2(F, K, T, sigma):
+    sigma_sqrt_t = sigma * np.sqrt(T)
+    d1 = (np.log(F / K) + 0.5 * sigma * sigma * T) / sigma_sqrt_t
+    return d1, d1 - sigma_sqrt_t
+
+
+def _bs_price_vec(F, K, r, T, sigma, is_call):
+    """
+    Black-76 option price
+
+    Args:
+        F: Futures/forward price
+        K: Strike price
+        r: Risk-free rate (decimal)
+        T: Time to expiry in years
+        sigma: Volatility (decimal)
+        is_call: True for calls, False for puts
+
+    Returns:
+        Option price (ndarray)
+    """
+    F, K, r, T, sigma = (np.asarray(x, dtype=np.float64) for x in (F, K, r, T, sigma))
+    d1, d2 = _d1_d2(F, K, T, sigma)
+    discount = np.exp(-r * T)
+    call = discount * (F * ndtr(d1) - K * ndtr(d2))
+    put = discount * (K * ndtr(-d2) - F * ndtr(-d1))
+    return np.where(is_call, call, put)
+
+
+def _bs_greeks_vec(F, K, r, T, sigma, is_call):
+    """
+    Black-76 Greeks computed from a single d1/d2 evaluation
+
+    Returns:
+        Tuple of (delta, gamma, theta, vega, rho) ndarrays
+    """
+    F, K, r, T, sigma = (np.asarray(x, dtype=np.float64) for x in (F, K, r, T, sigma))
+    sqrt_t = np.sqrt(T)
+    d1, d2 = _d1_d2(F, K, T, sigma)
+    discount = np.exp(-r * T)
+    pdf_d1 = _norm_pdf(d1)
+
+    # N(d) for calls, N(-d) for puts
+    sign = np.where(is_call, 1.0, -1.0)
+    n_d1 = ndtr(sign * d1)
+    n_d2 = ndtr(sign * d2)
+
+    delta = sign * discount * n_d1
+    gamma = discount * pdf_d1 / (F * sigma * sqrt_t)
+    decay = F * discount * pdf_d1 * sigma / (2.0 * sqrt_t)
+    theta = (-decay + sign * r * discount * (F * n_d1 - K * n_d2)) / 365.0
+    vega = F * discount * pdf_d1 * sqrt_t * 0.01
+    price = sign * discount * (F * n_d1 - K * n_d2)
+    rho = -T * price * 0.01
+
+    return delta, gamma, theta, vega, rho
+
+
+def _iv_bounds_status(price, F, K, r, T, is_call):
+    """
+    Classify option prices against the Black-76 no-arbitrage bounds
+
+    Returns:
+        int8 ndarray of _IV_OK, _IV_BELOW_INTRINSIC or _IV_ABOVE_MAXIMUM. An
+        _IV_OK price whose IV is still NaN means the solver did not converge.
+    """
+    price, F, K, r, T = (np.asarray(x, dtype=np.float64) for x in (price, F, K, r, T))
+    discount = np.exp(-r * T)
+    intrinsic = discount * np.where(is_call, np.maximum(F - K, 0.0), np.maximum(K - F, 0.0))
+    upper = discount * np.where(is_call, F, K)
+    return np.select(
+        [price <= intrinsic, price >= upper], [_IV_BELOW_INTRINSIC, _IV_ABOVE_MAXIMUM], _IV_OK
+    ).astype(np.int8)
+
+
+def _implied_vol_vec(price, F, K, r, T, is_call):
+    """
+    Black-76 implied volatility via safeguarded Newton iteration
+
+    The upper bound starts at _IV_UPPER and is doubled until the model price
+    there reaches the market price. Newton steps use vega as the derivative;
+    any step that leaves the current bracket falls back to bisection, so every
+    element converges even far from the money where vega vanishes.
+
+    Returns:
+        Implied volatility (decimal) ndarray. NaN where the price lies outside
+        the no-arbitrage bounds (below intrinsic or above the forward) or the
+        solver did not converge.
+    """
+    price, F, K, r, T = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (price, F, K, r, T))
+    )
+    is_call = np.broadcast_to(np.asarray(is_call, dtype=bool), price.shape)
+
+    discount = np.exp(-r * T)
+    valid = _iv_bounds_status(price, F, K, r, T, is_call) == _IV_OK
+
+    lo = np.full(price.shape, _IV_LOWER)
+    hi = np.full(price.shape, _IV_UPPER)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Widen the bracket where even _IV_UPPER prices below the market
+        for _ in range(_IV_MAX_EXPAND):
+            short = valid & (_bs_price_vec(F, K, r, T, hi, is_call) < price)
+            if not short.any():
+                break
+            lo = np.where(short, hi, lo)
+            hi = np.where(short, 2.0 * hi, hi)
+        else:
+            valid &= ~short  # never bracketed: report as not converged
+
+        # Brenner-Subrahmanyam ATM approximation as the starting point
+        sigma = np.clip(
+            np.sqrt(2.0 * np.pi / T) * price / (discount * F),
+            np.maximum(lo, _IV_LOWER * 10),
+            0.5 * hi,
+        )
+        sigma = np.where(valid, sigma, 0.2)
+        converged = ~valid
+
+        for _ in range(_IV_MAX_ITER):
+            diff = _bs_price_vec(F, K, r, T, sigma, is_call) - price
+            converged |= np.abs(diff) < _IV_TOLERANCE * np.maximum(price, 1.0)
+            if converged.all():
+                break
+
+            hi = np.where(diff > 0, sigma, hi)
+            lo = np.where(diff < 0, sigma, lo)
+
+            d1, _ = _d1_d2(F, K, T, sigma)
+            vega = F * discount * _norm_pdf(d1) * np.sqrt(T)
+            newton = sigma - diff / vega
+            bisect = 0.5 * (lo + hi)
+            step = np.where(np.isfinite(newton) & (newton > lo) & (newton < hi), newton, bisect)
+            sigma = np.where(converged, sigma, step)
+
+    return np.where(valid & converged, sigma, np.nan)
+
+
+def _bs_greeks_scalar(F, K, r, T, price, is_call):
+    """
+    Scalar Black-76 IV and Greeks, written with the math module only so numba
+    can compile it in nopython mode. Mirrors _implied_vol_vec/_bs_greeks_vec.
+
+    Returns:
+        Tuple of (iv, delta, gamma, theta, vega, rho); all NaN when the IV
+        cannot be solved
+    """
+    nan = math.nan
+    discount = math.exp(-r * T)
+    sign = 1.0 if is_call else -1.0
+    intrinsic = discount * max(sign * (F - K), 0.0)
+    upper = discount * (F if is_call else K)
+    if not (intrinsic < price < upper):
+        return nan, nan, nan, nan, nan, nan
+
+    sqrt_t = math.sqrt(T)
+    log_fk = math.log(F / K)
+    inv_sqrt_2pi = 1.0 / math.sqrt(2.0 * math.pi)
+    inv_sqrt_2 = 1.0 / math.sqrt(2.0)
+    tolerance = _IV_TOLERANCE * max(price, 1.0)
+
+    lo = _IV_LOWER
+    hi = _IV_UPPER
+    # Widen the bracket while even hi prices below the market
+    bracketed = False
+    for _ in range(_IV_MAX_EXPAND):
+        sigma_sqrt_t = hi * sqrt_t
+        d1 = (log_fk + 0.5 * sigma_sqrt_t * sigma_sqrt_t) / sigma_sqrt_t
+        d2 = d1 - sigma_sqrt_t
+        model = (
+            sign
+            * discount
+            * (
+                F * 0.5 * math.erfc(-sign * d1 * inv_sqrt_2)
+                - K * 0.5 * math.erfc(-sign * d2 * inv_sqrt_2)
+            )
+        )
+        if model >= price:
+            bracketed = True
+            break
+        lo = hi
+        hi *= 2.0
+    if not bracketed:
+        return nan, nan, nan, nan, nan, nan
+
+    sigma = math.sqrt(2.0 * math.pi / T) * price / (discount * F)
+    sigma = min(max(sigma, lo, _IV_LOWER * 10), 0.5 * hi)
+
+    converged = False
+    d1 = d2 = 0.0
+    for _ in range(_IV_MAX_ITER):
+        sigma_sqrt_t = sigma * sqrt_t
+        d1 = (log_fk + 0.5 * sigma_sqrt_t * sigma_sqrt_t) / sigma_sqrt_t
+        d2 = d1 - sigma_sqrt_t
+        model = (
+            sign
+            * discount
+            * (
+                F * 0.5 * math.erfc(-sign * d1 * inv_sqrt_2)
+                - K * 0.5 * math.erfc(-sign * d2 * inv_sqrt_2)
+            )
+        )
+        diff = model - price
+        if abs(diff) < tolerance:
+            converged = True
+            break
+
+        if diff > 0:
+            hi = sigma
+        else:
+            lo = sigma
+
+        vega = F * discount * inv_sqrt_2pi * math.exp(-0.5 * d1 * d1) * sqrt_t
+        newton = sigma - diff / vega if vega > 0 else lo
+        sigma = newton if lo < newton < hi else 0.5 * (lo + hi)
+
+    if not converged:
+        return nan, nan, nan, nan, nan, nan
+
+    pdf_d1 = inv_sqrt_2pi * math.exp(-0.5 * d1 * d1)
+    n_d1 = 0.5 * math.erfc(-sign * d1 * inv_sqrt_2)
+    n_d2 = 0.5 * math.erfc(-sign * d2 * inv_sqrt_2)
+    option_value = sign * discount * (F * n_d1 - K * n_d2)
+
+    delta = sign * discount * n_d1
+    gamma = discount * pdf_d1 / (F * sigma * sqrt_t)
+    decay = F * discount * pdf_d1 * sigma / (2.0 * sqrt_t)
+    theta = (-decay + r * option_value) / 365.0
+    vega = F * discount * pdf_d1 * sqrt_t * 0.01
+    rho = -T * option_value * 0.01
+
+    return sigma, delta, gamma, theta, vega, rho
+
+
+if njit is not None:
+    # Eager signature compiles on import; fastmath without nnan/ninf keeps NaN results reliable
+    bs_greeks = njit(
+        "UniTuple(float64, 6)(float64, float64, float64, float64, float64, boolean)",
+        cache=True,
+        fastmath={"nsz", "arcp", "contract", "reassoc"},
+    )(_bs_greeks_scalar)
+else:
+    # Plain-Python scalar math beats the NumPy kernel on 0-d arrays for one option
+    bs_greeks = _bs_greeks_scalar
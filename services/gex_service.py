@@ -10,7 +10,7 @@ from typing import Any
 
 from services.oi_tracker_service import _get_nearest_futures_price
 from services.option_chain_service import get_option_chain
-from services.option_greeks_service import calculate_greeks
+from services.option_greeks_service import calculate_greeks_batch
 from utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -63,6 +63,25 @@ def get_gex_data(
         elif options_exchange in ("BSE_INDEX", "BSE"):
             options_exchange = "BFO"
 
+        # Solve gamma for every CE/PE leg with a price and OI in one vectorized batch
+        legs = [
+            (leg["symbol"], leg["ltp"])
+            for item in full_chain
+            for leg in (item.get("ce"), item.get("pe"))
+            if leg and leg.get("symbol") and (leg.get("ltp") or 0) > 0 and (leg.get("oi") or 0) > 0
+        ]
+        greeks_by_symbol = {}
+        if legs:
+            leg_symbols, leg_prices = map(list, zip(*legs, strict=True))
+            try:
+                for greeks_resp in calculate_greeks_batch(
+                    leg_symbols, options_exchange, [spot_price] * len(legs), leg_prices
+                ):
+                    if greeks_resp.get("status") == "success":
+                        greeks_by_symbol[greeks_resp["symbol"]] = greeks_resp.get("greeks", {})
+            except Exception as e:
+                logger.warning(f"Failed to calculate greeks for {underlying} chain: {e}")
+
         lot_size = None
         gex_chain = []
 
@@ -82,48 +101,26 @@ def get_gex_data(
             # Process CE
             if ce and ce.get("symbol"):
                 ce_oi = ce.get("oi", 0) or 0
-                ce_ltp = ce.get("ltp", 0) or 0
                 current_lotsize = ce.get("lotsize", 1) or 1
                 if lot_size is None:
                     lot_size = current_lotsize
 
-                if ce_ltp > 0 and ce_oi > 0:
-                    try:
-                        ok, greeks_resp, _ = calculate_greeks(
-                            option_symbol=ce["symbol"],
-                            exchange=options_exchange,
-                            spot_price=spot_price,
-                            option_price=ce_ltp,
-                        )
-                        if ok and greeks_resp.get("status") == "success":
-                            greeks = greeks_resp.get("greeks", {})
-                            ce_gamma = greeks.get("gamma", 0) or 0
-                            ce_gex = ce_gamma * ce_oi * current_lotsize
-                    except Exception as e:
-                        logger.warning(f"Failed to calculate greeks for CE {ce.get('symbol')}: {e}")
+                greeks = greeks_by_symbol.get(ce["symbol"])
+                if greeks:
+                    ce_gamma = greeks.get("gamma", 0) or 0
+                    ce_gex = ce_gamma * ce_oi * current_lotsize
 
             # Process PE
             if pe and pe.get("symbol"):
                 pe_oi = pe.get("oi", 0) or 0
-                pe_ltp = pe.get("ltp", 0) or 0
                 current_lotsize = pe.get("lotsize", 1) or 1
                 if lot_size is None:
                     lot_size = current_lotsize
 
-                if pe_ltp > 0 and pe_oi > 0:
-                    try:
-                        ok, greeks_resp, _ = calculate_greeks(
-                            option_symbol=pe["symbol"],
-                            exchange=options_exchange,
-                            spot_price=spot_price,
-                            option_price=pe_ltp,
-                        )
-                        if ok and greeks_resp.get("status") == "success":
-                            greeks = greeks_resp.get("greeks", {})
-                            pe_gamma = greeks.get("gamma", 0) or 0
-                            pe_gex = pe_gamma * pe_oi * current_lotsize
-                    except Exception as e:
-                        logger.warning(f"Failed to calculate greeks for PE {pe.get('symbol')}: {e}")
+                greeks = greeks_by_symbol.get(pe["symbol"])
+                if greeks:
+                    pe_gamma = greeks.get("gamma", 0) or 0
+                    pe_gex = pe_gamma * pe_oi * current_lotsize
 
             net_gex = ce_gex - pe_gex
 
@@ -3,19 +3,21 @@ Option Greeks Service
 Calculates option Greeks (Delta, Gamma, Theta, Vega, Rho) and Implied Volatility
 for options across all supported exchanges (NFO, BFO, CDS, MCX)
 
-Uses Black-76 model (py_vollib) - appropriate for options on futures/forwards
+Uses Black-76 model (services/bs_kernel.py) - appropriate for options on futures/forwards
 which is the correct model for Indian F&O markets (NFO, BFO, MCX, CDS)
 """
 
+import math
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 
 from utils.constants import CRYPTO_EXCHANGES
 from utils.logging import get_logger
 
-# py_vollib is lazy-loaded inside calculate_greeks() and check_pyvollib_availability()
-# to avoid loading scipy/numba/llvmlite at startup
+# The Black-76 kernel (numpy/scipy) is lazy-loaded inside calculate_greeks() and
+# calculate_greeks_batch() to avoid loading scipy at startup
 
 logger = get_logger(__name__)
 
@@ -63,23 +65,26 @@ DEFAULT_INTEREST_RATES = {
     "MCX": 0,  # Commodities
 }
 
+# Pattern: SYMBOL + DD + MMM + YY + STRIKE + CE/PE
+# Strike can have decimal point for currencies
+_OPTION_RE = re.compile(r"([A-Z]+)(\d{2})([A-Z]{3})(\d{2})([\d.]+)(CE|PE)")
+
+_MONTH_MAP = {
+    "JAN": 1,
+    "FEB": 2,
+    "MAR": 3,
+    "APR": 4,
+    "MAY": 5,
+    "JUN": 6,
+    "JUL": 7,
+    "AUG": 8,
+    "SEP": 9,
+    "OCT": 10,
+    "NOV": 11,
+    "DEC": 12,
+}
 
-def check_pyvollib_availability():
-    """Check if py_vollib library is available"""
-    try:
-        from py_vollib.black.implied_volatility import implied_volatility as black_iv  # noqa: F401
-
-        return True, None, None
-    except ImportError:
-        logger.error("py_vollib library not installed. Install with: pip install py_vollib")
-        return (
-            False,
-            {
-                "status": "error",
-                "message": "Option Greeks calculation requires py_vollib library. Install with: pip install py_vollib",
-            },
-            500,
-        )
+_INV_SECONDS_PER_DAY = 1.0 / 86400.0
 
 
 def parse_option_symbol(
@@ -110,31 +115,14 @@ def parse_option_symbol(
         # CRYPTO canonical format (BTC28FEB2580000CE) uses the same
         # Indian F&O-style symbology as NFO/MCX — the regex below handles both.
 
-        # Pattern: SYMBOL + DD + MMM + YY + STRIKE + CE/PE
-        # Strike can have decimal point for currencies
-        match = re.match(r"([A-Z]+)(\d{2})([A-Z]{3})(\d{2})([\d.]+)(CE|PE)", symbol.upper())
+        # Broker symbols are almost always uppercase already - skip the copy
+        match = _OPTION_RE.match(symbol if symbol.isupper() else symbol.upper())
 
         if not match:
             raise ValueError(f"Invalid option symbol format: {symbol}")
 
         base_symbol, day, month_str, year, strike_str, opt_type = match.groups()
 
-        # Month mapping
-        month_map = {
-            "JAN": 1,
-            "FEB": 2,
-            "MAR": 3,
-            "APR": 4,
-            "MAY": 5,
-            "JUN": 6,
-            "JUL": 7,
-            "AUG": 8,
-            "SEP": 9,
-            "OCT": 10,
-            "NOV": 11,
-            "DEC": 12,
-        }
-
         # Determine expiry time
         if custom_expiry_time:
             # Parse custom expiry time (format: "HH:MM")
@@ -150,7 +138,7 @@ def parse_option_symbol(
                     raise ValueError(
                         f"Invalid expiry_time values: {custom_expiry_time}. Hour must be 0-23, minute must be 0-59"
                     )
-                logger.info(f"Using custom expiry time: {custom_expiry_time}")
+                logger.debug("Using custom expiry time: %s", custom_expiry_time)
             except Exception as e:
                 raise ValueError(f"Failed to parse expiry_time '{custom_expiry_time}': {str(e)}")
         else:
@@ -169,24 +157,30 @@ def parse_option_symbol(
                 expiry_minute = 30
 
         expiry = datetime(
-            int("20" + year), month_map[month_str], int(day), expiry_hour, expiry_minute
+            int("20" + year), _MONTH_MAP[month_str], int(day), expiry_hour, expiry_minute
         )
 
         # Convert strike to proper format
         # Strike must be in same units as futures price for Black-76
         strike = float(strike_str)
 
-        logger.info(
-            f"Parsed symbol {symbol}: base={base_symbol}, expiry={expiry}, strike={strike}, type={opt_type}"
+        logger.debug(
+            "Parsed symbol %s: base=%s, expiry=%s, strike=%s, type=%s",
+            symbol,
+            base_symbol,
+            expiry,
+            strike,
+            opt_type,
         )
 
         return base_symbol, expiry, strike, opt_type.upper()
 
     except Exception as e:
-        logger.exception(f"Error parsing option symbol {symbol}: {e}")
+        logger.exception("Error parsing option symbol %s: %s", symbol, e)
         raise ValueError(f"Failed to parse option symbol {symbol}: {str(e)}")
 
 
+@lru_cache(maxsize=1024)
 def get_underlying_exchange(base_symbol: str, options_exchange: str) -> str:
     """
     Determine the underlying exchange based on symbol and options exchange
@@ -218,38 +212,145 @@ def get_underlying_exchange(base_symbol: str, options_exchange: str) -> str:
     return "NSE"
 
 
-def calculate_time_to_expiry(expiry: datetime) -> tuple[float, float]:
+def calculate_time_to_expiry(expiry: datetime, now: datetime | None = None) -> tuple[float, float]:
     """
-    Calculate time to expiry in years (for py_vollib Black-76 model)
+    Calculate time to expiry in years (for the Black-76 model)
 
-    py_vollib expects time to expiry in YEARS.
+    The Black-76 kernel expects time to expiry in YEARS.
     Also returns days for display purposes.
 
+    Args:
+        expiry: Expiry datetime
+        now: Valuation time; defaults to datetime.now(). Pass one value for
+            every leg of a batch so all legs share the same instant.
+
     Returns:
         Tuple of (time_in_years, time_in_days)
     """
-    current_time = datetime.now()
+    current_time = now or datetime.now()
 
     if expiry < current_time:
-        logger.warning(f"Option has already expired: {expiry}")
+        logger.warning("Option has already expired: %s", expiry)
         return 0.0, 0.0
 
     # Calculate time to expiry
     time_delta = expiry - current_time
-    days_to_expiry = time_delta.total_seconds() / (60 * 60 * 24)
+    days_to_expiry = time_delta.total_seconds() * _INV_SECONDS_PER_DAY
     years_to_expiry = days_to_expiry / 365.0
 
     # Ensure minimum value to avoid numerical issues
     if years_to_expiry < 0.0001:  # Less than ~1 hour
         years_to_expiry = 0.0001
         days_to_expiry = years_to_expiry * 365.0
-        logger.info("Very close to expiry - using minimum 0.0001 years")
+        logger.debug("Very close to expiry - using minimum 0.0001 years")
 
-    logger.info(f"Time to expiry: {days_to_expiry:.4f} days ({years_to_expiry:.6f} years)")
+    logger.debug("Time to expiry: %.4f days (%.6f years)", days_to_expiry, years_to_expiry)
 
     return years_to_expiry, days_to_expiry
 
 
+@lru_cache(maxsize=256)
+def _fmt_expiry(expiry: datetime) -> str:
+    """Expiry date as shown in responses; a chain only has a handful of distinct expiries"""
+    return expiry.strftime("%d-%b-%Y")
+
+
+def _theoretical_greeks_response(
+    option_symbol: str,
+    exchange: str,
+    base_symbol: str,
+    strike: float,
+    opt_type: str,
+    expiry: datetime,
+    time_to_expiry_days: float,
+    spot_price: float,
+    option_price: float,
+    intrinsic_value: float,
+    interest_rate: float,
+    note: str,
+) -> dict[str, Any]:
+    """
+    Build the response for options whose IV cannot be solved (no time value)
+
+    Returns theoretical deep ITM Greeks: IV=0, Delta=+/-1, Gamma=Theta=Vega=Rho=0
+    """
+    return {
+        "status": "success",
+        "symbol": option_symbol,
+        "exchange": exchange,
+        "underlying": base_symbol,
+        "strike": round(strike, 2),
+        "option_type": opt_type,
+        "expiry_date": _fmt_expiry(expiry),
+        "days_to_expiry": round(time_to_expiry_days, 4),
+        "spot_price": round(spot_price, 2),
+        "option_price": round(option_price, 2),
+        "intrinsic_value": round(intrinsic_value, 2),
+        "time_value": round(max(option_price - intrinsic_value, 0), 2),
+        "interest_rate": round(interest_rate, 2),
+        "implied_volatility": 0,
+        "greeks": {
+            "delta": 1.0 if opt_type == "CE" else -1.0,
+            "gamma": 0,
+            "theta": 0,
+            "vega": 0,
+            "rho": 0,
+        },
+        "note": note,
+    }
+
+
+def _format_response(
+    option_symbol: str,
+    exchange: str,
+    base_symbol: str,
+    strike: float,
+    opt_type: str,
+    expiry: datetime,
+    time_to_expiry_days: float,
+    spot_price: float,
+    option_price: float,
+    interest_rate: float,
+    implied_volatility: float,
+    greeks: tuple[float, float, float, float, float],
+    round_greeks: bool = True,
+) -> dict[str, Any]:
+    """
+    Build the success response for a solved option
+
+    Args:
+        implied_volatility: IV in percent
+        greeks: (delta, gamma, theta, vega, rho)
+        round_greeks: Round IV and Greeks to response precision. The batch path
+            passes False because it already rounds whole arrays with np.round.
+    """
+    delta, gamma, theta, vega, rho = greeks
+    if round_greeks:
+        implied_volatility = round(implied_volatility, 2)
+        delta, gamma, theta, vega, rho = (
+            round(delta, 4),
+            round(gamma, 6),
+            round(theta, 4),
+            round(vega, 4),
+            round(rho, 6),
+        )
+    return {
+        "status": "success",
+        "symbol": option_symbol,
+        "exchange": exchange,
+        "underlying": base_symbol,
+        "strike": round(strike, 2),
+        "option_type": opt_type,
+        "expiry_date": _fmt_expiry(expiry),
+        "days_to_expiry": round(time_to_expiry_days, 4),
+        "spot_price": round(spot_price, 2),
+        "option_price": round(option_price, 2),
+        "interest_rate": round(interest_rate, 2),
+        "implied_volatility": implied_volatility,
+        "greeks": {"delta": delta, "gamma": gamma, "theta": theta, "vega": vega, "rho": rho},
+    }
+
+
 def calculate_greeks(
     option_symbol: str,
     exchange: str,
@@ -258,9 +359,11 @@ def calculate_greeks(
     interest_rate: float = None,
     expiry_time: str = None,
     api_key: str = None,
+    now: datetime | None = None,
+    parsed: tuple[str, datetime, float, str] | None = None,
 ) -> tuple[bool, dict[str, Any], int]:
     """
-    Calculate Option Greeks using Black-76 model (py_vollib)
+    Calculate Option Greeks using Black-76 model
 
     Black-76 is the appropriate model for options on futures/forwards,
     which includes Indian F&O markets (NFO, BFO, MCX, CDS).
@@ -273,44 +376,46 @@ def calculate_greeks(
         interest_rate: Risk-free interest rate (annualized %)
         expiry_time: Optional custom expiry time in "HH:MM" format
         api_key: API key for logging/tracking
+        now: Optional valuation time (defaults to datetime.now())
+        parsed: Optional parse_option_symbol() result, if the caller already has it
 
     Returns:
         Tuple of (success, response_dict, status_code)
     """
     try:
-        # Check if py_vollib is available and import (lazy-loaded to avoid startup overhead)
+        # Black-76 kernel is lazy-loaded to avoid pulling numpy/scipy in at startup
         try:
-            from py_vollib.black.greeks.analytical import delta as black_delta
-            from py_vollib.black.greeks.analytical import gamma as black_gamma
-            from py_vollib.black.greeks.analytical import rho as black_rho
-            from py_vollib.black.greeks.analytical import theta as black_theta
-            from py_vollib.black.greeks.analytical import vega as black_vega
-            from py_vollib.black.implied_volatility import implied_volatility as black_iv
+            from services.bs_kernel import (
+                _IV_ABOVE_MAXIMUM,
+                _IV_OK,
+                _iv_bounds_status,
+                bs_greeks,
+            )
         except ImportError:
-            logger.error("py_vollib library not installed.")
+            logger.error("numpy/scipy not installed.")
             return (
                 False,
                 {
                     "status": "error",
-                    "message": "Option Greeks calculation requires py_vollib library. Install with: pip install py_vollib",
+                    "message": "Option Greeks calculation requires numpy and scipy. Install with: pip install numpy scipy",
                 },
                 500,
             )
 
-        # Parse option symbol with custom expiry time if provided
-        base_symbol, expiry, strike, opt_type = parse_option_symbol(
+        # Parse option symbol with custom expiry time if provided (unless already parsed)
+        base_symbol, expiry, strike, opt_type = parsed or parse_option_symbol(
             option_symbol, exchange, expiry_time
         )
 
         # Calculate time to expiry (returns years and days)
-        time_to_expiry_years, time_to_expiry_days = calculate_time_to_expiry(expiry)
+        time_to_expiry_years, time_to_expiry_days = calculate_time_to_expiry(expiry, now)
 
         if time_to_expiry_years <= 0:
             return (
                 False,
                 {
                     "status": "error",
-                    "message": f"Option has expired on {expiry.strftime('%d-%b-%Y')}",
+                    "message": f"Option has expired on {_fmt_expiry(expiry)}",
                 },
                 400,
             )
@@ -320,7 +425,7 @@ def calculate_greeks(
             interest_rate = DEFAULT_INTEREST_RATES.get(exchange, 0)
 
         # Convert interest rate from percentage to decimal
-        # py_vollib expects decimal (0.065 for 6.5%)
+        # The kernel expects decimal (0.065 for 6.5%)
         interest_rate_decimal = interest_rate / 100.0
 
         # Validate inputs
@@ -334,9 +439,6 @@ def calculate_greeks(
         if strike <= 0:
             return False, {"status": "error", "message": "Strike price must be positive"}, 400
 
-        # Set option flag for py_vollib ('c' for call, 'p' for put)
-        flag = "c" if opt_type == "CE" else "p"
-
         # Calculate intrinsic value to validate option price
         if opt_type == "CE":
             intrinsic_value = max(spot_price - strike, 0)
@@ -351,167 +453,109 @@ def calculate_greeks(
             # Return theoretical Greeks: IV=0, Delta=+/-1, Gamma=0, Theta=0, Vega=0
             logger.info("Deep ITM option with no time value - returning theoretical Greeks")
 
-            response = {
-                "status": "success",
-                "symbol": option_symbol,
-                "exchange": exchange,
-                "underlying": base_symbol,
-                "strike": round(strike, 2),
-                "option_type": opt_type,
-                "expiry_date": expiry.strftime("%d-%b-%Y"),
-                "days_to_expiry": round(time_to_expiry_days, 4),
-                "spot_price": round(spot_price, 2),
-                "option_price": round(option_price, 2),
-                "intrinsic_value": round(intrinsic_value, 2),
-                "time_value": round(max(time_value, 0), 2),
-                "interest_rate": round(interest_rate, 2),
-                "implied_volatility": 0,  # No IV for deep ITM
-                "greeks": {
-                    "delta": 1.0 if opt_type == "CE" else -1.0,  # Deep ITM delta
-                    "gamma": 0,
-                    "theta": 0,
-                    "vega": 0,
-                    "rho": 0,
-                },
-                "note": "Deep ITM option with no time value - theoretical Greeks returned",
-            }
-            return True, response, 200
-
-        # Calculate Implied Volatility using Black-76 model
-        try:
-            # black_iv(price, F, K, r, t, flag)
-            # Returns IV as decimal (e.g., 0.15 for 15%)
-            implied_volatility_decimal = black_iv(
-                option_price, spot_price, strike, interest_rate_decimal, time_to_expiry_years, flag
-            )
-            # Convert to percentage for display
-            implied_volatility = implied_volatility_decimal * 100.0
-
-        except Exception as e:
-            logger.exception(f"Error calculating IV: {e}")
-            error_msg = str(e)
-            # If IV calculation fails due to numerical issues, return theoretical deep ITM Greeks
-            if (
-                "intrinsic" in error_msg.lower()
-                or "below" in error_msg.lower()
-                or "convergence" in error_msg.lower()
-            ):
-                logger.info(
-                    "IV calculation failed - returning theoretical Greeks for deep ITM option"
-                )
-                response = {
-                    "status": "success",
-                    "symbol": option_symbol,
-                    "exchange": exchange,
-                    "underlying": base_symbol,
-                    "strike": round(strike, 2),
-                    "option_type": opt_type,
-                    "expiry_date": expiry.strftime("%d-%b-%Y"),
-                    "days_to_expiry": round(time_to_expiry_days, 4),
-                    "spot_price": round(spot_price, 2),
-                    "option_price": round(option_price, 2),
-                    "intrinsic_value": round(intrinsic_value, 2),
-                    "time_value": round(max(time_value, 0), 2),
-                    "interest_rate": round(interest_rate, 2),
-                    "implied_volatility": 0,  # No IV calculable
-                    "greeks": {
-                        "delta": 1.0 if opt_type == "CE" else -1.0,
-                        "gamma": 0,
-                        "theta": 0,
-                        "vega": 0,
-                        "rho": 0,
-                    },
-                    "note": "IV calculation not possible - theoretical deep ITM Greeks returned",
-                }
-                return True, response, 200
-            return (
-                False,
-                {
-                    "status": "error",
-                    "message": f"Failed to calculate Implied Volatility: {error_msg}",
-                },
-                500,
-            )
-
-        # Calculate Greeks using Black-76 model
-        try:
-            # All Greek functions: func(flag, F, K, t, r, sigma)
-            # sigma is IV as decimal
-            delta = black_delta(
-                flag,
-                spot_price,
+            response = _theoretical_greeks_response(
+                option_symbol,
+                exchange,
+                base_symbol,
                 strike,
-                time_to_expiry_years,
-                interest_rate_decimal,
-                implied_volatility_decimal,
-            )
-            gamma = black_gamma(
-                flag,
+                opt_type,
+                expiry,
+                time_to_expiry_days,
                 spot_price,
-                strike,
-                time_to_expiry_years,
-                interest_rate_decimal,
-                implied_volatility_decimal,
-            )
-            theta = black_theta(
-                flag,
-                spot_price,
-                strike,
-                time_to_expiry_years,
-                interest_rate_decimal,
-                implied_volatility_decimal,
+                option_price,
+                intrinsic_value,
+                interest_rate,
+                "Deep ITM option with no time value - theoretical Greeks returned",
             )
-            vega = black_vega(
-                flag,
+            return True, response, 200
+
+        # Calculate Implied Volatility and Greeks using Black-76 model in one call
+        # IV is returned as decimal (e.g., 0.15 for 15%), NaN when not solvable
+        # Greeks are in trader-friendly units:
+        # - theta: daily theta (no conversion needed)
+        # - vega: per 1% vol change (no conversion needed)
+        implied_volatility_decimal, delta, gamma, theta, vega, rho = bs_greeks(
+            float(spot_price),
+            float(strike),
+            interest_rate_decimal,
+            time_to_expiry_years,
+            float(option_price),
+            opt_type == "CE",
+        )
+
+        if math.isnan(implied_volatility_decimal):
+            iv_status = _iv_bounds_status(
+                option_price,
                 spot_price,
                 strike,
-                time_to_expiry_years,
                 interest_rate_decimal,
-                implied_volatility_decimal,
-            )
-            rho = black_rho(
-                flag,
-                spot_price,
-                strike,
                 time_to_expiry_years,
-                interest_rate_decimal,
-                implied_volatility_decimal,
+                opt_type == "CE",
             )
+            if iv_status == _IV_ABOVE_MAXIMUM:
+                logger.warning(
+                    "Option price %s for %s is above the Black-76 maximum value",
+                    option_price,
+                    option_symbol,
+                )
+                return (
+                    False,
+                    {
+                        "status": "error",
+                        "message": "Failed to calculate Implied Volatility: The volatility is above the maximum value.",
+                    },
+                    500,
+                )
 
-            # Note: py_vollib Black model returns Greeks in trader-friendly units:
-            # - theta: already daily theta (no conversion needed)
-            # - vega: already per 1% vol change (no conversion needed)
+            if iv_status == _IV_OK:
+                # Inside the no-arbitrage bounds but the solver could not bracket or converge
+                logger.warning(
+                    "IV solver did not converge for %s at %s", option_symbol, option_price
+                )
+                return (
+                    False,
+                    {
+                        "status": "error",
+                        "message": "Failed to calculate Implied Volatility: IV solver did not converge",
+                    },
+                    500,
+                )
 
-        except Exception as e:
-            logger.exception(f"Error calculating Greeks: {e}")
-            return (
-                False,
-                {"status": "error", "message": f"Failed to calculate Greeks: {str(e)}"},
-                500,
+            # Below intrinsic value after discounting: no time value to solve
+            logger.info("IV calculation failed - returning theoretical Greeks for deep ITM option")
+            response = _theoretical_greeks_response(
+                option_symbol,
+                exchange,
+                base_symbol,
+                strike,
+                opt_type,
+                expiry,
+                time_to_expiry_days,
+                spot_price,
+                option_price,
+                intrinsic_value,
+                interest_rate,
+                "IV calculation not possible - theoretical deep ITM Greeks returned",
             )
+            return True, response, 200
 
-        # Build response
-        response = {
-            "status": "success",
-            "symbol": option_symbol,
-            "exchange": exchange,
-            "underlying": base_symbol,
-            "strike": round(strike, 2),
-            "option_type": opt_type,
-            "expiry_date": expiry.strftime("%d-%b-%Y"),
-            "days_to_expiry": round(time_to_expiry_days, 4),
-            "spot_price": round(spot_price, 2),
-            "option_price": round(option_price, 2),
-            "interest_rate": round(interest_rate, 2),
-            "implied_volatility": round(implied_volatility, 2),
-            "greeks": {
-                "delta": round(delta, 4),
-                "gamma": round(gamma, 6),
-                "theta": round(theta, 4),
-                "vega": round(vega, 4),
-                "rho": round(rho, 6),
-            },
-        }
+        # Convert to percentage for display
+        implied_volatility = implied_volatility_decimal * 100.0
+
+        response = _format_response(
+            option_symbol,
+            exchange,
+            base_symbol,
+            strike,
+            opt_type,
+            expiry,
+            time_to_expiry_days,
+            spot_price,
+            option_price,
+            interest_rate,
+            implied_volatility,
+            (delta, gamma, theta, vega, rho),
+        )
 
         logger.info(f"Greeks calculated successfully for {option_symbol} using Black-76 model")
         return True, response, 200
@@ -529,6 +573,253 @@ def calculate_greeks(
         )
 
 
+def calculate_greeks_batch(
+    symbols: list[str],
+    exchange: str | list[str],
+    spot_prices: list[float],
+    option_prices: list[float],
+    interest_rate: float | None = None,
+    expiry_time: str | None = None,
+    api_key: str | None = None,
+    now: datetime | None = None,
+    parsed: list[tuple[str, datetime, float, str]] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Calculate Option Greeks for many options in one vectorized Black-76 pass
+
+    Symbols are parsed and validated individually; IV and Greeks for all valid
+    options are then solved together as NumPy arrays instead of one
+    calculate_greeks() call per option.
+
+    Args:
+        symbols: Option symbols (e.g., NIFTY28NOV2424000CE)
+        exchange: Exchange code, or one exchange per symbol
+        spot_prices: Underlying futures/forward price per symbol
+        option_prices: Current option price per symbol
+        interest_rate: Risk-free interest rate (annualized %)
+        expiry_time: Optional custom expiry time in "HH:MM" format
+        api_key: API key for logging/tracking
+        now: Optional valuation time; taken once so every option in the batch
+            is priced at the same instant
+        parsed: Optional parse_option_symbol() results, one per symbol, if the
+            caller already has them
+
+    Returns:
+        List of response dicts in input order, same shape as calculate_greeks()
+        responses. Failed entries carry status "error" with symbol/exchange.
+    """
+    exchanges = [exchange] * len(symbols) if isinstance(exchange, str) else list(exchange)
+
+    try:
+        import numpy as np
+
+        from services.bs_kernel import (
+            _IV_ABOVE_MAXIMUM,
+            _IV_OK,
+            _bs_greeks_vec,
+            _implied_vol_vec,
+            _iv_bounds_status,
+        )
+    except ImportError:
+        logger.error("numpy/scipy not installed.")
+        return [
+            {
+                "status": "error",
+                "symbol": symbol,
+                "exchange": exch,
+                "message": "Option Greeks calculation requires numpy and scipy. Install with: pip install numpy scipy",
+            }
+            for symbol, exch in zip(symbols, exchanges, strict=True)
+        ]
+
+    now = now or datetime.now()
+    results: list[dict[str, Any] | None] = [None] * len(symbols)
+    pending = []  # (index, base_symbol, expiry, strike, opt_type, years, days, rate)
+
+    def _error(idx, message):
+        results[idx] = {
+            "status": "error",
+            "symbol": symbols[idx],
+            "exchange": exchanges[idx],
+            "message": message,
+        }
+
+    # Step 1: Parse and validate each option, resolving deep ITM options directly
+    for idx, (symbol, exch, spot_price, option_price) in enumerate(
+        zip(symbols, exchanges, spot_prices, option_prices, strict=True)
+    ):
+        try:
+            base_symbol, expiry, strike, opt_type = (
+                parsed[idx] if parsed else parse_option_symbol(symbol, exch, expiry_time)
+            )
+        except ValueError as e:
+            _error(idx, str(e))
+            continue
+
+        time_to_expiry_years, time_to_expiry_days = calculate_time_to_expiry(expiry, now)
+        if time_to_expiry_years <= 0:
+            _error(idx, f"Option has expired on {_fmt_expiry(expiry)}")
+            continue
+
+        rate = DEFAULT_INTEREST_RATES.get(exch, 0) if interest_rate is None else interest_rate
+
+        if not spot_price or not option_price or spot_price <= 0 or option_price <= 0:
+            _error(idx, "Spot price and option price must be positive")
+            continue
+        if strike <= 0:
+            _error(idx, "Strike price must be positive")
+            continue
+
+        if opt_type == "CE":
+            intrinsic_value = max(spot_price - strike, 0)
+        else:  # PE
+            intrinsic_value = max(strike - spot_price, 0)
+
+        time_value = option_price - intrinsic_value
+        if time_value <= 0 or (intrinsic_value > 0 and time_value < 0.01):
+            results[idx] = _theoretical_greeks_response(
+                symbol,
+                exch,
+                base_symbol,
+                strike,
+                opt_type,
+                expiry,
+                time_to_expiry_days,
+                spot_price,
+                option_price,
+                intrinsic_value,
+                rate,
+                "Deep ITM option with no time value - theoretical Greeks returned",
+            )
+            continue
+
+        pending.append(
+            (
+                idx,
+                base_symbol,
+                expiry,
+                strike,
+                opt_type,
+                time_to_expiry_years,
+                time_to_expiry_days,
+                rate,
+            )
+        )
+
+    # Step 2: Solve IV and Greeks for all remaining options in one pass
+    if pending:
+        idxs = [p[0] for p in pending]
+        F = np.fromiter((spot_prices[i] for i in idxs), float, len(idxs))
+        price = np.fromiter((option_prices[i] for i in idxs), float, len(idxs))
+        K = np.fromiter((p[3] for p in pending), float, len(pending))
+        is_call = np.fromiter((p[4] == "CE" for p in pending), bool, len(pending))
+        T = np.fromiter((p[5] for p in pending), float, len(pending))
+        r = np.fromiter((p[7] for p in pending), float, len(pending)) / 100.0
+
+        iv = _implied_vol_vec(price, F, K, r, T, is_call)
+        with np.errstate(invalid="ignore"):
+            delta, gamma, theta, vega, rho = _bs_greeks_vec(F, K, r, T, iv, is_call)
+        iv_status = _iv_bounds_status(price, F, K, r, T, is_call)
+
+        columns = zip(
+            pending,
+            np.isnan(iv).tolist(),
+            iv_status.tolist(),
+            np.round(iv * 100.0, 2).tolist(),
+            np.round(delta, 4).tolist(),
+            np.round(gamma, 6).tolist(),
+            np.round(theta, 4).tolist(),
+            np.round(vega, 4).tolist(),
+            np.round(rho, 6).tolist(),
+            strict=True,
+        )
+        for (
+            (idx, base_symbol, expiry, strike, opt_type, _, days, rate),
+            failed,
+            status,
+            *values,
+        ) in columns:
+            symbol, exch = symbols[idx], exchanges[idx]
+            spot_price, option_price = spot_prices[idx], option_prices[idx]
+
+            if failed and status == _IV_ABOVE_MAXIMUM:
+                _error(
+                    idx,
+                    "Failed to calculate Implied Volatility: The volatility is above the maximum value.",
+                )
+                continue
+
+            if failed and status == _IV_OK:
+                _error(idx, "Failed to calculate Implied Volatility: IV solver did not converge")
+                continue
+
+            if failed:
+                intrinsic_value = max(
+                    spot_price - strike if opt_type == "CE" else strike - spot_price, 0
+                )
+                results[idx] = _theoretical_greeks_response(
+                    symbol,
+                    exch,
+                    base_symbol,
+                    strike,
+                    opt_type,
+                    expiry,
+                    days,
+                    spot_price,
+                    option_price,
+                    intrinsic_value,
+                    rate,
+                    "IV calculation not possible - theoretical deep ITM Greeks returned",
+                )
+                continue
+
+            iv_pct, *greeks = values
+            results[idx] = _format_response(
+                symbol,
+                exch,
+                base_symbol,
+                strike,
+                opt_type,
+                expiry,
+                days,
+                spot_price,
+                option_price,
+                rate,
+                iv_pct,
+                greeks,
+                round_greeks=False,
+            )
+
+    logger.info(f"Batch Greeks calculated for {len(pending)}/{len(symbols)} options via Black-76")
+    return results
+
+
+def _fetch_ltps(pairs: list[tuple[str, str]], api_key: str | None) -> dict[tuple[str, str], float]:
+    """
+    Fetch LTPs for several (symbol, exchange) pairs with a single multiquotes call
+
+    Returns:
+        Dict of (symbol, exchange) -> ltp for every pair that returned a non-zero LTP.
+        Empty when the broker call fails, so callers can fall back to get_quotes().
+    """
+    from services.quotes_service import get_multiquotes
+
+    ltps = {}
+    try:
+        success, response, _ = get_multiquotes(
+            symbols=[{"symbol": symbol, "exchange": exch} for symbol, exch in pairs],
+            api_key=api_key,
+        )
+        if success and "results" in response:
+            for result in response["results"]:
+                ltp = (result.get("data") or {}).get("ltp")
+                if ltp:
+                    ltps[(result.get("symbol"), result.get("exchange"))] = ltp
+    except Exception as e:
+        logger.warning(f"Multiquotes fetch failed: {e}")
+    return ltps
+
+
 def get_option_greeks(
     option_symbol: str,
     exchange: str,
@@ -569,6 +860,7 @@ def get_option_greeks(
             # User provided custom forward price (e.g., synthetic future)
             spot_price = forward_price
             logger.info(f"Using custom forward price: {forward_price}")
+            prefetched = {}
         else:
             # Fetch underlying price from broker
             # Use provided underlying symbol/exchange or derive from option symbol
@@ -584,41 +876,56 @@ def get_option_greeks(
             else:
                 spot_exchange = get_underlying_exchange(base_symbol, exchange)
 
-            # Fetch underlying price
-            logger.info(f"Fetching spot price for {spot_symbol} from {spot_exchange}")
-            success, spot_response, status_code = get_quotes(spot_symbol, spot_exchange, api_key)
+            # Fetch underlying and option prices together in one broker round trip
+            prefetched = _fetch_ltps(
+                [(spot_symbol, spot_exchange), (option_symbol, exchange)], api_key
+            )
+
+            spot_price = prefetched.get((spot_symbol, spot_exchange))
+            if not spot_price:
+                # Fall back to a single quote request for a precise error
+                logger.info(f"Fetching spot price for {spot_symbol} from {spot_exchange}")
+                success, spot_response, status_code = get_quotes(
+                    spot_symbol, spot_exchange, api_key
+                )
+
+                if not success:
+                    return (
+                        False,
+                        {
+                            "status": "error",
+                            "message": f"Failed to fetch underlying price: {spot_response.get('message', 'Unknown error')}",
+                        },
+                        status_code,
+                    )
+
+                spot_price = spot_response.get("data", {}).get("ltp")
+                if not spot_price:
+                    return (
+                        False,
+                        {"status": "error", "message": "Underlying LTP not available"},
+                        404,
+                    )
+
+        # Fetch option price (unless already fetched with the underlying)
+        option_price = prefetched.get((option_symbol, exchange))
+        if not option_price:
+            logger.info(f"Fetching option price for {option_symbol} from {exchange}")
+            success, option_response, status_code = get_quotes(option_symbol, exchange, api_key)
 
             if not success:
                 return (
                     False,
                     {
                         "status": "error",
-                        "message": f"Failed to fetch underlying price: {spot_response.get('message', 'Unknown error')}",
+                        "message": f"Failed to fetch option price: {option_response.get('message', 'Unknown error')}",
                     },
                     status_code,
                 )
 
-            spot_price = spot_response.get("data", {}).get("ltp")
-            if not spot_price:
-                return False, {"status": "error", "message": "Underlying LTP not available"}, 404
-
-        # Fetch option price
-        logger.info(f"Fetching option price for {option_symbol} from {exchange}")
-        success, option_response, status_code = get_quotes(option_symbol, exchange, api_key)
-
-        if not success:
-            return (
-                False,
-                {
-                    "status": "error",
-                    "message": f"Failed to fetch option price: {option_response.get('message', 'Unknown error')}",
-                },
-                status_code,
-            )
-
-        option_price = option_response.get("data", {}).get("ltp")
-        if not option_price:
-            return False, {"status": "error", "message": "Option LTP not available"}, 404
+            option_price = option_response.get("data", {}).get("ltp")
+            if not option_price:
+                return False, {"status": "error", "message": "Option LTP not available"}, 404
 
         # Calculate Greeks
         return calculate_greeks(
@@ -629,6 +936,7 @@ def get_option_greeks(
             interest_rate=interest_rate,
             expiry_time=expiry_time,
             api_key=api_key,
+            parsed=(base_symbol, expiry, strike, opt_type),
         )
 
     except Exception as e:
@@ -644,8 +952,8 @@ def get_multi_option_greeks(
 ) -> tuple[bool, dict[str, Any], int]:
     """
     Get option Greeks for multiple symbols in a single call.
-    Optimized to fetch spot prices once per underlying and batch option prices
-    via get_multiquotes(), minimizing broker API calls.
+    Optimized to fetch all spot and option prices in a single get_multiquotes()
+    call, falling back to get_quotes() only for spots the batch did not return.
 
     Args:
         symbols: List of dicts with 'symbol', 'exchange', optional 'underlying_symbol', 'underlying_exchange'
@@ -656,7 +964,7 @@ def get_multi_option_greeks(
     Returns:
         Tuple of (success, response_dict, status_code)
     """
-    from services.quotes_service import get_multiquotes, get_quotes
+    from services.quotes_service import get_quotes
 
     # Early return for empty symbols list
     if not symbols:
@@ -698,8 +1006,25 @@ def get_multi_option_greeks(
                 "message": f"Failed to parse option symbol: {str(e)}",
             })
 
-    # Step 2: Fetch spot prices — one API call per unique underlying
+    # Step 2: Fetch every spot and option LTP in one multiquotes call
+    option_keys = [
+        (sym_req.get("symbol"), sym_req.get("exchange"))
+        for sym_req in symbols
+        if sym_req.get("symbol") in parsed_symbols  # only if parsing succeeded
+    ]
+    ltps = {}
+    if option_keys:
+        logger.info(
+            f"Batch fetching {len(spot_keys)} spot and {len(option_keys)} option prices via multiquotes"
+        )
+        ltps = _fetch_ltps(list(dict.fromkeys([*spot_keys, *option_keys])), api_key)
+
+    # Step 3: Fall back to get_quotes() for any spot the batch did not return
     for spot_key in spot_keys:
+        spot_price = ltps.get(spot_key)
+        if spot_price:
+            spot_keys[spot_key] = spot_price
+            continue
         spot_symbol, spot_exchange = spot_key
         try:
             logger.info(f"Fetching spot price for {spot_symbol} from {spot_exchange}")
@@ -715,34 +1040,8 @@ def get_multi_option_greeks(
         except Exception as e:
             logger.warning(f"Error fetching spot for {spot_symbol}: {e}")
 
-    # Step 3: Batch fetch all option prices via get_multiquotes()
-    option_symbols_to_fetch = []
-    for sym_req in symbols:
-        symbol = sym_req.get("symbol")
-        if symbol in parsed_symbols:  # only if parsing succeeded
-            option_symbols_to_fetch.append({
-                "symbol": symbol,
-                "exchange": sym_req.get("exchange"),
-            })
-
-    option_prices = {}  # symbol -> ltp
-    if option_symbols_to_fetch:
-        logger.info(f"Batch fetching {len(option_symbols_to_fetch)} option prices via multiquotes")
-        try:
-            mq_success, mq_response, mq_status = get_multiquotes(
-                symbols=option_symbols_to_fetch, api_key=api_key
-            )
-            if mq_success and "results" in mq_response:
-                for result in mq_response["results"]:
-                    sym = result.get("symbol")
-                    if sym and "data" in result:
-                        ltp = result["data"].get("ltp")
-                        if ltp:
-                            option_prices[sym] = ltp
-        except Exception as e:
-            logger.warning(f"Multiquotes fetch failed: {e}")
-
-    # Step 4: Calculate Greeks for each symbol using fetched prices
+    # Step 4: Collect fetched prices for each symbol
+    ready = []  # (symbol, exchange, spot_price, option_price, parsed)
     for sym_req in symbols:
         symbol = sym_req.get("symbol")
         exchange = sym_req.get("exchange")
@@ -765,7 +1064,7 @@ def get_multi_option_greeks(
             continue
 
         # Get option price
-        option_price = option_prices.get(symbol)
+        option_price = ltps.get((symbol, exchange))
         if not option_price:
             failed_count += 1
             results.append({
@@ -776,33 +1075,39 @@ def get_multi_option_greeks(
             })
             continue
 
-        # Calculate Greeks (pure math, no API calls)
+        ready.append((symbol, exchange, spot_price, option_price, parsed_symbols[symbol]))
+
+    # Calculate Greeks for all priced options in one vectorized pass (pure math, no API calls)
+    if ready:
         try:
-            calc_success, calc_response, calc_status = calculate_greeks(
-                option_symbol=symbol,
-                exchange=exchange,
-                spot_price=spot_price,
-                option_price=option_price,
+            batch_symbols, batch_exchanges, batch_spots, batch_prices, batch_parsed = map(
+                list, zip(*ready, strict=True)
+            )
+            for calc_response in calculate_greeks_batch(
+                batch_symbols,
+                batch_exchanges,
+                batch_spots,
+                batch_prices,
                 interest_rate=interest_rate,
                 expiry_time=expiry_time,
                 api_key=api_key,
-            )
-            if calc_success:
-                success_count += 1
-            else:
-                failed_count += 1
-                calc_response.setdefault("symbol", symbol)
-                calc_response.setdefault("exchange", exchange)
-            results.append(calc_response)
+                parsed=batch_parsed,
+            ):
+                if calc_response.get("status") == "success":
+                    success_count += 1
+                else:
+                    failed_count += 1
+                results.append(calc_response)
         except Exception as e:
-            logger.exception(f"Error calculating Greeks for {symbol}: {e}")
-            failed_count += 1
-            results.append({
-                "status": "error",
-                "symbol": symbol,
-                "exchange": exchange,
-                "message": str(e),
-            })
+            logger.exception(f"Error calculating batch Greeks: {e}")
+            for symbol, exchange, *_ in ready:
+                failed_count += 1
+                results.append({
+                    "status": "error",
+                    "symbol": symbol,
+                    "exchange": exchange,
+                    "message": str(e),
+                })
 
     # Sort results to maintain original order
     symbol_order = {sym["symbol"]: idx for idx, sym in enumerate(symbols)}
@@ -6,9 +6,10 @@ at the current instant using live option chain quotes + Black-76 IV calculation.
 Uses OTM convention: CE IV for strikes >= ATM, PE IV for strikes < ATM.
 """
 
+from datetime import datetime
 from typing import Any
 
-from services.option_greeks_service import calculate_greeks, parse_option_symbol
+from services.option_greeks_service import calculate_greeks_batch, parse_option_symbol
 from services.option_symbol_service import (
     construct_crypto_option_symbol,
     construct_option_symbol,
@@ -149,6 +150,7 @@ def get_vol_surface_data(
         # Step 4: For each expiry, fetch option LTPs and compute IV
         surface = []  # surface[expiry_idx][strike_idx] = IV
         expiry_info = []
+        now = datetime.now()  # one valuation time for the whole surface
 
         for ed in expiry_strike_data:
             expiry = ed["expiry"]
@@ -183,43 +185,40 @@ def get_vol_surface_data(
                         data = result.get("data", result)
                         quotes_map[sym] = data.get("ltp", 0)
 
-            # Compute IV for each strike
-            iv_row = []
-            for strike in common_strikes:
-                if strike >= atm_strike:
-                    sym = _build_sym(base_symbol, expiry, strike, "CE")
-                else:
-                    sym = _build_sym(base_symbol, expiry, strike, "PE")
-
-                option_ltp = quotes_map.get(sym, 0)
-
-                if not option_ltp or option_ltp <= 0:
-                    iv_row.append(None)
-                    continue
-
+            # Compute IV for every priced strike in one vectorized batch
+            row_symbols = [
+                _build_sym(base_symbol, expiry, strike, "CE" if strike >= atm_strike else "PE")
+                for strike in common_strikes
+            ]
+            priced = [
+                (sym, quotes_map[sym]) for sym in row_symbols if (quotes_map.get(sym) or 0) > 0
+            ]
+
+            iv_map = {}  # symbol -> IV
+            if priced:
                 try:
-                    ok, greeks_resp, _ = calculate_greeks(
-                        option_symbol=sym,
-                        exchange=options_exchange,
-                        spot_price=underlying_ltp,
-                        option_price=option_ltp,
-                    )
-                    if ok and greeks_resp.get("status") == "success":
+                    batch_symbols, batch_prices = map(list, zip(*priced, strict=True))
+                    for greeks_resp in calculate_greeks_batch(
+                        batch_symbols,
+                        options_exchange,
+                        [underlying_ltp] * len(priced),
+                        batch_prices,
+                        now=now,
+                    ):
                         iv_val = greeks_resp.get("implied_volatility")
-                        iv_row.append(round(iv_val, 2) if iv_val and iv_val > 0 else None)
-                    else:
-                        iv_row.append(None)
-                except Exception:
-                    iv_row.append(None)
+                        if greeks_resp.get("status") == "success" and iv_val and iv_val > 0:
+                            iv_map[greeks_resp["symbol"]] = round(iv_val, 2)
+                except Exception as e:
+                    logger.warning(f"Failed to calculate IV for {base_symbol} {expiry}: {e}")
 
+            iv_row = [iv_map.get(sym) for sym in row_symbols]
             surface.append(iv_row)
 
             # Compute DTE from parsed symbol
             try:
                 test_sym = _build_sym(base_symbol, expiry, common_strikes[0], "CE")
                 _, expiry_dt, _, _ = parse_option_symbol(test_sym, options_exchange)
-                from datetime import datetime
-                dte = max(0, (expiry_dt - datetime.now()).total_seconds() / 86400)
+                dte = max(0, (expiry_dt - now).total_seconds() / 86400)
                 expiry_info.append({"date": expiry, "dte": round(dte, 1)})
             except Exception:
                 expiry_info.append({"date": expiry, "dte": 0})
@@ -0,0 +1,162 @@
+"""
+Black-76 Kernel Test Suite
+
+Checks services/bs_kernel.py against py_vollib's Black model, which the option
+Greeks service used before the kernel replaced it. Runs without a broker or app.
+
+Usage:
+    uv run pytest test/test_bs_kernel.py -v
+"""
+
+import itertools
+import math
+
+import numpy as np
+import pytest
+from py_vollib.black import black
+from py_vollib.black.greeks.analytical import delta, gamma, rho, theta, vega
+from py_vollib.black.implied_volatility import implied_volatility
+
+from services import bs_kernel
+from services.bs_kernel import (
+    _IV_ABOVE_MAXIMUM,
+    _IV_BELOW_INTRINSIC,
+    _IV_OK,
+    _bs_greeks_scalar,
+    _bs_greeks_vec,
+    _implied_vol_vec,
+    _iv_bounds_status,
+)
+
+# ---------------------------------------------------------------------------
+# Test grid: NIFTY-like forward across moneyness, expiry, rate, flag and vol
+# ---------------------------------------------------------------------------
+FORWARD = 24000.0
+MONEYNESS = [0.8, 0.9, 0.95, 1.0, 1.05, 1.1, 1.2]
+EXPIRIES = [0.0001, 0.002, 0.02, 0.1, 0.5, 1.0]  # years; 0.0001 is the service's floor
+RATES = [0.0, 0.065]
+FLAGS = ["c", "p"]
+VOLS = [0.05, 0.15, 0.3, 0.8]
+
+
+def _grid():
+    """Priced grid points with at least 0.01 of time value, as the service requires"""
+    cases = []
+    for m, T, r, flag, sigma in itertools.product(MONEYNESS, EXPIRIES, RATES, FLAGS, VOLS):
+        K = FORWARD * m
+        price = black(flag, FORWARD, K, T, r, sigma)
+        intrinsic = max(FORWARD - K, 0.0) if flag == "c" else max(K - FORWARD, 0.0)
+        if price - intrinsic >= 0.01:
+            cases.append((FORWARD, K, r, T, price, flag))
+    return cases
+
+
+GRID = _grid()
+
+
+def _reference(F, K, r, T, price, flag):
+    """py_vollib IV and Greeks in the kernel's (iv, delta, gamma, theta, vega, rho) order"""
+    iv = implied_volatility(price, F, K, r, T, flag)
+    return (
+        iv,
+        delta(flag, F, K, T, r, iv),
+        gamma(flag, F, K, T, r, iv),
+        theta(flag, F, K, T, r, iv),
+        vega(flag, F, K, T, r, iv),
+        rho(flag, F, K, T, r, iv),
+    )
+
+
+def _kernels():
+    """Single-option kernels: the plain-Python fallback, plus numba when installed"""
+    params = [pytest.param(_bs_greeks_scalar, id="python")]
+    marks = [] if bs_kernel.njit is not None else [pytest.mark.skip(reason="numba not installed")]
+    params.append(pytest.param(bs_kernel.bs_greeks, id="numba", marks=marks))
+    return params
+
+
+class TestAgainstPyVollib:
+    """Kernel results match py_vollib.black on the grid"""
+
+    def test_grid_is_not_empty(self):
+        assert len(GRID) > 300
+
+    def test_implied_vol_vec(self):
+        F, K, r, T, price, flag = (np.array(col) for col in zip(*GRID, strict=True))
+        iv = _implied_vol_vec(price, F, K, r, T, flag == "c")
+        expected = [implied_volatility(p, f, k, rr, t, fl) for f, k, rr, t, p, fl in GRID]
+        np.testing.assert_allclose(iv, expected, rtol=0, atol=1e-6)
+
+    def test_bs_greeks_vec(self):
+        F, K, r, T, price, flag = (np.array(col) for col in zip(*GRID, strict=True))
+        reference = np.array([_reference(*case) for case in GRID])
+        greeks = _bs_greeks_vec(F, K, r, T, reference[:, 0], flag == "c")
+        for column, values in enumerate(greeks, start=1):
+            np.testing.assert_allclose(values, reference[:, column], rtol=1e-9, atol=1e-12)
+
+    @pytest.mark.parametrize("kernel", _kernels())
+    def test_bs_greeks(self, kernel):
+        for F, K, r, T, price, flag in GRID:
+            expected = _reference(F, K, r, T, price, flag)
+            result = kernel(F, K, r, T, price, flag == "c")
+            # IV matches to 1e-6; Greeks then follow from the slightly different IV
+            assert result[0] == pytest.approx(expected[0], rel=0, abs=1e-6)
+            assert result[1:] == pytest.approx(expected[1:], rel=1e-4, abs=1e-8)
+
+
+class TestEdgeCases:
+    """No-arbitrage bounds and near-expiry behaviour"""
+
+    def test_below_intrinsic(self):
+        # Deep ITM call priced under its discounted intrinsic value
+        F, K, r, T, price = 24000.0, 23000.0, 0.065, 0.05, 990.0
+        with pytest.raises(Exception, match="below the intrinsic"):
+            implied_volatility(price, F, K, r, T, "c")
+
+        assert _iv_bounds_status(price, F, K, r, T, True) == _IV_BELOW_INTRINSIC
+        assert math.isnan(_implied_vol_vec(price, F, K, r, T, True))
+        for kernel in (_bs_greeks_scalar, bs_kernel.bs_greeks):
+            assert all(math.isnan(value) for value in kernel(F, K, r, T, price, True))
+
+    def test_above_maximum(self):
+        # OTM call priced above the discounted forward
+        F, K, r, T, price = 24000.0, 25000.0, 0.065, 0.05, 24500.0
+        with pytest.raises(Exception, match="above the maximum"):
+            implied_volatility(price, F, K, r, T, "c")
+
+        assert _iv_bounds_status(price, F, K, r, T, True) == _IV_ABOVE_MAXIMUM
+        assert math.isnan(_implied_vol_vec(price, F, K, r, T, True))
+        for kernel in (_bs_greeks_scalar, bs_kernel.bs_greeks):
+            assert all(math.isnan(value) for value in kernel(F, K, r, T, price, True))
+
+    @pytest.mark.parametrize("kernel", _kernels())
+    def test_iv_above_initial_bracket(self, kernel):
+        # OTM call minutes from expiry whose IV (~9800%) is far above _IV_UPPER
+        F, K, r, T, price = 1500.0, 1722.0, 0.0, 0.0001, 500.0
+        expected = _reference(F, K, r, T, price, "c")
+        assert expected[0] > bs_kernel._IV_UPPER
+
+        assert _iv_bounds_status(price, F, K, r, T, True) == _IV_OK
+        iv = _implied_vol_vec(price, F, K, r, T, True)
+        assert float(iv) == pytest.approx(expected[0], rel=1e-8)
+        assert kernel(F, K, r, T, price, True) == pytest.approx(expected, rel=1e-6, abs=1e-8)
+
+    def test_bounds_status_vectorized(self):
+        price = np.array([990.0, 24500.0, 250.0])
+        K = np.array([23000.0, 25000.0, 24200.0])
+        status = _iv_bounds_status(price, 24000.0, K, 0.065, 0.05, True)
+        assert status.tolist() == [_IV_BELOW_INTRINSIC, _IV_ABOVE_MAXIMUM, _IV_OK]
+
+    @pytest.mark.parametrize("flag", FLAGS)
+    def test_near_expiry(self, flag):
+        # ATM option with ~50 minutes left, at the service's minimum time to expiry
+        F, K, r, T = 24000.0, 24000.0, 0.065, 0.0001
+        price = black(flag, F, K, T, r, 0.15)
+        expected = _reference(F, K, r, T, price, flag)
+
+        iv = _implied_vol_vec(price, F, K, r, T, flag == "c")
+        assert float(iv) == pytest.approx(expected[0], abs=1e-6)
+        for kernel in (_bs_greeks_scalar, bs_kernel.bs_greeks):
+            assert kernel(F, K, r, T, price, flag == "c") == pytest.approx(
+                expected, rel=1e-4, abs=1e-8
+            )